@@ -23,24 +23,31 @@ This project needs:
  - ssh
 '''
 
-from burp import IBurpExtender, ITab, IHttpListener, IMessageEditorController, IContextMenuFactory, IScanIssue, IHttpService, IHttpRequestResponse, IBurpExtenderCallbacks
+from burp import IBurpExtender, IExtensionStateListener, ITab, IHttpListener, IMessageEditorController, IContextMenuFactory, IScanIssue, IHttpService, IHttpRequestResponse, IBurpExtenderCallbacks
 from java.awt import Component
 from java.awt.event import ActionListener
 from java.io import PrintWriter
+from java.lang import StringBuilder
 from java.util import ArrayList, List
 from java.net import URL
-from javax.swing import JScrollPane, JSplitPane, JTabbedPane, JTable, SwingUtilities, JPanel, JButton, JLabel, JMenuItem, BoxLayout, Box, JTextField
+from javax.swing import JScrollPane, JSplitPane, JTabbedPane, JTable, SwingUtilities, JPanel, JButton, JLabel, JMenuItem, BoxLayout, Box, JTextField, Timer, SwingWorker
+from javax.swing.event import ChangeListener
 from javax.swing.table import AbstractTableModel
-from threading import Lock
-import datetime, os, hashlib
+from threading import Lock, RLock, Thread
+from Queue import Queue, Empty
+import datetime, os, hashlib, time, re, itertools, errno
 import sys
 
 
+# Set BURP_GIT_BRIDGE_DEBUG=1 to log every git/ssh command and its output
+DEBUG = os.environ.get("BURP_GIT_BRIDGE_DEBUG") == "1"
+
+
 '''
 Entry point for Burp Git Bridge extension.
 '''
 
-class BurpExtender(IBurpExtender):
+class BurpExtender(IBurpExtender, IExtensionStateListener):
     '''
     Entry point for plugin; creates UI and Log
     '''
@@ -71,7 +78,19 @@ class BurpExtender(IBurpExtender):
         self.log = Log(callbacks)
         self.ui = BurpUi(callbacks, self.log)
         self.log.setUi(self.ui)
-        self.log.reload()
+        callbacks.registerExtensionStateListener(self)
+
+        # Load the repo in the background so the UI shows up right away;
+        # rows are added to the table as they are read
+
+        self.log.request_reload()
+
+    def extensionUnloaded(self):
+        '''
+        Invoked by Burp when the extension is unloaded
+        '''
+
+        self.log.close()
        
        
 
@@ -80,28 +99,97 @@ Classes that support logging of data to in-Burp extension UI as well
 as the underlying git repo
 '''
 
+# Fields with few distinct values, shared by all entries that have them. 
+# A dict is used rather than the intern builtin, which rejects unicode 
+# (e.g. values coming from Burp's Java strings).
+
+_INTERNED_FIELDS = ("tool", "host", "protocol")
+_interned = {}
+
+def _intern(value):
+    return _interned.setdefault(value, value)
+
 class LogEntry(object):
     '''
     Hacky dictionary used to store Burp tool data. Objects of this class 
     are stored in the Java-style table represented in the Burp UI table.
     They are created by the BurpUi when a user sends Burp tool data to Git 
     Bridge, or by Git Bridge when a user's git repo is reloaded into Burp.
+
+    Attributes starting with an underscore are in-memory bookkeeping only:
+    they are not hashed nor written to the git repo.
     '''
     def __init__(self, *args, **kwargs):
         self.__dict__ = kwargs
+        self._intern_fields()
+        self._set_payload_flags()
+
+        # Hash most of the tool data to uniquely identify this entry. Fields
+        # are serialized in sorted order into one buffer and hashed in a
+        # single call.
+
+        buf = bytearray()
+        for k, data in sorted(self._serialize_fields().items()):
+            if not data:
+                continue
+            buf.extend(k)
+            buf.extend("\0")
+            buf.extend(data[:2048])
+        self.md5 = hashlib.md5(bytes(buf)).hexdigest()
+
+    def _intern_fields(self):
+        '''
+        Replaces the values of _INTERNED_FIELDS with their shared copy
+        '''
+
+        for key in _INTERNED_FIELDS:
+            if key in self.__dict__:
+                self.__dict__[key] = _intern(self.__dict__[key])
+
+    @staticmethod
+    def _serialize(value):
+        '''
+        Returns the bytes (a str) stored in the git repo for a field value
+        '''
+
+        if not value:
+            return ""
+        if hasattr(value, "tostring"):
+            # Java byte[] (e.g. request/response)
+            return value.tostring()
+        if isinstance(value, unicode):
+            return value.encode("utf-8")
+        if not getattr(value, "__getitem__", False):
+            return str(value)
+        return value
+
+    def _serialize_fields(self):
+        '''
+        Returns {field: bytes} for every field stored in the git repo. Used 
+        both to hash the entry and by GitLog.write_entry.
+        '''
+
+        return dict((k, LogEntry._serialize(v)) for k, v in self.__dict__.items()
+                if k != "messages" and not k.startswith("_"))
+
+    def set_field(self, key, value):
+        '''
+        Sets a single field in place. The entry keeps its md5 since that 
+        names its directory in the git repo.
+        '''
 
+        self.__dict__[key] = value
+        self.__dict__.pop("_scan_summary", None)
 
-        # Hash most of the tool data to uniquely identify this entry.
-        # Note: Could be more pythonic.
+    def _set_payload_flags(self):
+        '''
+        Notes once whether the entry holds a non-empty request and response,
+        so the UI doesn't have to look at the payloads to decide which tabs
+        to show
+        '''
 
-        md5 = hashlib.md5()
-        for k, v in self.__dict__.iteritems():
-            if v and k != "messages": 
-                if not getattr(v, "__getitem__", False):
-                    v = str(v)
-                md5.update(k)
-                md5.update(v[:2048])
-        self.md5 = md5.hexdigest()
+        self._has_request = bool(self.__dict__.get("request"))
+        self._has_response = bool(self.__dict__.get("response"))
 
 
 
@@ -113,6 +201,9 @@ class Log():
     in-Burp Git Bridge log is reloaded from the underlying git repo.
     '''
 
+    # Entries added to the table per Swing event while reloading
+    RELOAD_BATCH = 200
+
     def __init__(self, callbacks):
         '''
         Creates GUI log and git log objects
@@ -123,6 +214,9 @@ class Log():
         self._helpers = callbacks.getHelpers()
         self.gui_log = GuiLog(callbacks)
         self.git_log = GitLog(callbacks)
+        self._reload_pending = False
+        self._reload_pending_lock = Lock()
+        self._reload_lock = Lock()
 
     def setUi(self, ui):
         '''
@@ -139,11 +233,43 @@ class Log():
 
     def reload(self):
         '''
-        Reloads the Log from on the on-disk git repo.
+        Reloads the Log from on the on-disk git repo. Entries are handed to 
+        the table in batches as they are read.
         '''
         self.gui_log.clear() 
+        batch = []
         for entry in self.git_log.entries():
-            self.gui_log.add_entry(entry)
+            batch.append(entry)
+            if len(batch) >= Log.RELOAD_BATCH:
+                self.gui_log.add_entries(batch)
+                batch = []
+        if batch:
+            self.gui_log.add_entries(batch)
+
+    def request_reload(self):
+        '''
+        Reloads the Log in the background. Requests made while a reload is 
+        already waiting to run are coalesced into it.
+        '''
+
+        with self._reload_pending_lock:
+            if self._reload_pending:
+                return
+            self._reload_pending = True
+        Thread(target=self._reload_once, name="git-bridge-reload").start()
+
+    def _reload_once(self):
+        '''
+        Runs one pending reload, after any reload already in flight
+        '''
+
+        with self._reload_lock:
+            with self._reload_pending_lock:
+                self._reload_pending = False
+            try:
+                self.reload()
+            except Exception as e:
+                print("Reload failed: %s" % e)
 
     def add_repeater_entry(self, messageInfo):
         '''
@@ -215,13 +341,14 @@ class Log():
         self.gui_log.add_entry(entry)
         self.git_log.add_scanner_entry(entry)
 
-    def remove(self, entry):
+    def remove_entries(self, entries):
         '''
-        Removes the supplied entry from the Log
+        Removes the supplied entries from the Log, updating the GUI table 
+        once for all of them
         '''
 
-        self.git_log.remove(entry)
-        self.gui_log.remove_entry(entry) 
+        self.git_log.remove_entries(entries)
+        self.gui_log.remove_entries(entries)
 
     def pull(self):
         '''
@@ -249,11 +376,16 @@ class Log():
         self.gui_log.clear()
         self.git_log.delete_repo_local(repo)
 
-    def set_description(self, entry_hash, description):
+    def set_descriptions(self, entries, description):
         '''
-        Set the supplied data to git config
+        Sets the description of the supplied entries with a single git 
+        commit, and updates the in-memory entries that could be edited
         '''
-        self.git_log.set_description(entry_hash, description)
+        edited = self.git_log.set_descriptions([entry.md5 for entry in entries], description)
+        for entry in entries:
+            if entry.md5 in edited:
+                entry.set_field("description", description)
+                self.gui_log.update_entry(entry)
 
     def get_actual_repo_uri(self):
         '''
@@ -267,6 +399,12 @@ class Log():
         '''
         return self.git_log.get_key_pub()
 
+    def close(self):
+        '''
+        Releases resources held by the git log
+        '''
+        self.git_log.close()
+
     def reload_project(self):
         '''
         Reload config of burp project
@@ -287,6 +425,7 @@ class GuiLog(AbstractTableModel):
 
         self.ui = None
         self._log = ArrayList()
+        self._md5_to_row = {}
         self._lock = Lock()
         self._callbacks = callbacks
         self._helpers = callbacks.getHelpers()
@@ -298,45 +437,140 @@ class GuiLog(AbstractTableModel):
                 "Who",
                 "Description"]
 
+        # The displayed values, one ArrayList per column, so the table reads
+        # a cell without going through the LogEntry
+        self._columns = [ArrayList() for _ in self.cols]
+
+    @staticmethod
+    def _row_values(entry):
+        '''
+        Returns the value of each column for entry
+        '''
+
+        tool = getattr(entry, "tool", "")
+        if tool == "scanner":
+            issue = getattr(entry, "issue_name", "")
+        else:
+            issue = "N/A"
+        return (getattr(entry, "timestamp", ""),
+                tool.capitalize(),
+                getattr(entry, "url", ""),
+                issue,
+                getattr(entry, "who", ""),
+                getattr(entry, "description", ""))
+
+    # The table (and its row sorter) must never see the model change before
+    # the matching event, so changes made from other threads are applied 
+    # together with their event on the Swing thread.
+
     def clear(self):
         '''
         Clears all entries from the table
         '''
 
+        SwingUtilities.invokeLater(self._clear)
+
+    def _clear(self):
+        '''
+        Clears the model and fires the event. Runs on the Swing thread.
+        '''
+
         self._lock.acquire()
         last = self._log.size()
         if last > 0:
             self._log.clear()
-            self.fireTableRowsDeleted(0, last-1)
-        # Note: if callees modify table this could deadlock
+            for column in self._columns:
+                column.clear()
+        self._md5_to_row.clear()
         self._lock.release()
+        if last > 0:
+            self.fireTableRowsDeleted(0, last-1)
 
     def add_entry(self, entry):
         '''
         Adds entry to the table
         '''
 
+        self.add_entries([entry])
+
+    def add_entries(self, entries):
+        '''
+        Adds entries to the table, firing a single table event
+        '''
+
+        entries = list(entries)
+        values = [GuiLog._row_values(entry) for entry in entries]
+        SwingUtilities.invokeLater(lambda: self._add_rows(entries, values))
+
+    def _add_rows(self, entries, values):
+        '''
+        Appends entries and their column values to the model and fires the 
+        event. Runs on the Swing thread.
+        '''
+
+        if not entries:
+            return
         self._lock.acquire()
-        row = self._log.size()
-        self._log.add(entry)
-        # Note: if callees modify table this could deadlock
-        self.fireTableRowsInserted(row, row)
+        first = self._log.size()
+        for entry, row_values in zip(entries, values):
+            self._md5_to_row[entry.md5] = self._log.size()
+            self._log.add(entry)
+            for column, value in zip(self._columns, row_values):
+                column.add(value)
+        last = self._log.size() - 1
         self._lock.release()
+        self.fireTableRowsInserted(first, last)
 
-    def remove_entry(self, entry):
+    def remove_entries(self, entries):
         '''
-        Removes entry from the table
+        Removes entries from the table, highest row first so the remaining
+        rows stay valid, firing a single table event. Must be called from 
+        the Swing thread.
         '''
 
         self._lock.acquire()
-        for i in range(0, len(self._log)):
-            ei = self._log[i] 
-            if ei.md5 == entry.md5:
-                self._log.remove(i)
-                break
-        self.fireTableRowsDeleted(i, i) 
+        rows = sorted(set(self._md5_to_row[e.md5] for e in entries 
+                if e.md5 in self._md5_to_row), reverse=True)
+        for i in rows:
+            self._log.remove(i)
+            for column in self._columns:
+                column.remove(i)
+        if rows:
+            # Re-index once instead of shifting the index per removed row
+            self._md5_to_row = dict((e.md5, i) for i, e in enumerate(self._log))
         self._lock.release()
 
+        if not rows:
+            return
+        first, last = rows[-1], rows[0]
+        if last - first == len(rows) - 1:
+            self.fireTableRowsDeleted(first, last)
+        else:
+            self.fireTableDataChanged()
+
+    def update_entry(self, entry):
+        '''
+        Notifies the table that entry changed in place
+        '''
+
+        values = GuiLog._row_values(entry)
+        SwingUtilities.invokeLater(lambda: self._update_row(entry, values))
+
+    def _update_row(self, entry, values):
+        '''
+        Replaces the column values of entry's row and fires the event. Runs 
+        on the Swing thread.
+        '''
+
+        self._lock.acquire()
+        i = self._md5_to_row.get(entry.md5)
+        if i is not None:
+            for column, value in zip(self._columns, values):
+                column.set(i, value)
+        self._lock.release()
+        if i is not None:
+            self.fireTableRowsUpdated(i, i)
+
     def getRowCount(self):
         '''
         Used by the Java Swing UI 
@@ -368,34 +602,36 @@ class GuiLog(AbstractTableModel):
         '''
         Gets the LogEntry at rowIndex
         '''
-        l = self._log.get(rowIndex)
         return self._log.get(rowIndex)
+
+    def get_entries(self, rowIndexes):
+        '''
+        Gets the LogEntries at rowIndexes as one consistent snapshot. A 
+        contiguous run of rows (e.g. a shift-click selection) is copied 
+        with a single toArray call instead of a get per row.
+        '''
+        self._lock.acquire()
+        try:
+            if len(rowIndexes) > 1:
+                first, last = rowIndexes[0], rowIndexes[-1]
+                if rowIndexes == range(first, last + 1):
+                    return list(self._log.subList(first, last + 1).toArray())
+            return [self._log.get(i) for i in rowIndexes]
+        finally:
+            self._lock.release()
     
     def getValueAt(self, rowIndex, columnIndex):
         '''
         Used by the Java Swing UI 
         '''
 
-        logEntry = self._log.get(rowIndex)
-        if columnIndex == 0:
-            return logEntry.timestamp
-        elif columnIndex == 1:
-            return logEntry.tool.capitalize()
-        elif columnIndex == 2:
-            return logEntry.url
-        elif columnIndex == 3:
-            if logEntry.tool == "scanner":
-                return logEntry.issue_name
-            else:
-                return "N/A"
-        elif columnIndex == 4:
-            return logEntry.who
-        elif columnIndex == 5:
-            return logEntry.description
+        return self._columns[columnIndex].get(rowIndex)
+
+import os, subprocess, shutil
 
-        return ""
+_RECENT_PROJECT_NAME_RE = re.compile(r'suite\.recentProjectNames(\d+)"\s+value="([^"]*)"')
+_RECENT_PROJECT_FILE_RE = re.compile(r'suite\.recentProjectFiles(\d+)"\s+value="([^"]*)"')
 
-import os, subprocess
 class GitLog(object):
     '''
     Represents the underlying Git Repo that stores user information. Used 
@@ -403,6 +639,14 @@ class GitLog(object):
     path.
     '''
 
+    PROJECT_NAME_TTL = 2 # seconds
+
+    # Per-repo git settings applied by _tune_repo. core.fscache only has an 
+    # effect on Windows and is ignored elsewhere.
+    REPO_TUNING = (("core.preloadindex", "true"),
+            ("core.fscache", "true"),
+            ("feature.manyFiles", "true"))
+
     def __init__(self, callbacks):
         '''
         Initializes git repo config
@@ -423,20 +667,42 @@ class GitLog(object):
         self.user = None
         self.email = None
         self.key_pub = self._get_key_pub()
+        self._project_name_cache = None
+        self._known_hosts_servers = set()
+        self._known_hosts_lock = Lock()
+        self._cat_file_process = None
+        self._cat_file_repo = None
+        self._cat_file_lock = Lock()
+
+        # Serializes git commands that touch the index or HEAD, since pushes 
+        # run on their own thread
+        self._git_lock = RLock()
+        # Serializes fetches, which compete for the remote-tracking ref locks
+        # and FETCH_HEAD, without making commits wait on the network
+        self._fetch_lock = Lock()
+        self._push_q = Queue()
+        push_worker = Thread(target=self._push_worker, name="git-bridge-push")
+        push_worker.daemon = True
+        push_worker.start()
         
         self.reload_project()
 
     def reload_project(self):
-        # Load project-repo relations
+        # Load project-repo relations. The file is an append-only journal:
+        # later lines override earlier ones for the same project.
         self.project_repo_rels = {}
         if os.path.exists(self.project_repo_path):
             with open(self.project_repo_path, "r") as f:
-                for line in f.read().split('\n'):
-                    try:
-                        proj_name, repo = line.split(',')
-                        self.project_repo_rels[proj_name] = repo
-                    except Exception as e:
-                        print("Cannot be unpacked file project_repo_path in line {}".format(line))
+                content = f.read()
+            lines = [line for line in content.split('\n') if line]
+            for line in lines:
+                try:
+                    proj_name, repo = line.split(',')
+                    self.project_repo_rels[proj_name] = repo
+                except Exception as e:
+                    print("Cannot be unpacked file project_repo_path in line {}".format(line))
+            if not content.endswith('\n') or len(lines) > 10 * len(self.project_repo_rels):
+                self._compact_project_repo_rels()
 
         # Load actual project name. If it is temporary project loads lastone. can it be hacked better?
         self.project_name = self.get_current_project_name()
@@ -446,16 +712,15 @@ class GitLog(object):
             self.project_path = None
         else:
             try:
-                # TODO: This can be better, right?
+                # Map recent project ids to names and files in one pass each,
+                # then pick the most recent id whose name matches
                 with open(self.burp_config_path, "r") as f:
-                    config = f.read().split('\n')
-                    for line in config:
-                        if 'suite.recentProjectNames' in line and self.project_name in line:
-                            temp_project_id = line.split('suite.recentProjectNames')[1].split('" value="')[0]
-                            search = 'suite.recentProjectNames'+temp_project_id
-                            for line in config:
-                                if search in line:
-                                    self.project_path = line.split('value="')[1].split('"/>')[0]
+                    config = f.read()
+                names = dict(_RECENT_PROJECT_NAME_RE.findall(config))
+                files = dict(_RECENT_PROJECT_FILE_RE.findall(config))
+                ids = sorted(int(i) for i, name in names.items() if name == self.project_name)
+                if ids:
+                    self.project_path = files.get(str(ids[0]))
             except:
                 self.project_name = None
                 self.project_path = None
@@ -475,6 +740,8 @@ class GitLog(object):
         if self.project_name in self.project_repo_rels.keys():
             self.repo_uri = self.project_repo_rels[self.project_name]
             self.repo_path = self._generate_path_repo_name(self._extract_repo_name(self.repo_uri))
+            self._tune_repo()
+            self._prefetch()
         else:
             self.repo_uri = None
         
@@ -483,17 +750,25 @@ class GitLog(object):
     def save_current_project_repo(self):
         print("saving project_repo_rels file project {} with repo {}".format(self.project_name, self.repo_uri))
         self.project_repo_rels[self.project_name] = self.repo_uri
-        lines = '\n'.join(['{},{}'.format(k,v) for k, v in self.project_repo_rels.items()])
+        with open(self.project_repo_path, "a") as f:
+            f.write('{},{}\n'.format(self.project_name, self.repo_uri))
+
+    def _compact_project_repo_rels(self):
+        '''
+        Rewrites the project-repo relations file with one line per project
+        '''
+        lines = ''.join(['{},{}\n'.format(k,v) for k, v in self.project_repo_rels.items()])
         with open(self.project_repo_path, "w") as f:
             f.write(lines)
 
     def _run_subprocess_command(self, cmd_list, cwd=None, quiet=False):
         process = subprocess.Popen(cmd_list, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         out, err = process.communicate()
-        print("Subprocess: {}".format(cmd_list))
-        if not quiet:
-            print(out)
-            print(err)
+        if DEBUG:
+            print("Subprocess: {}".format(cmd_list))
+            if not quiet:
+                print(out)
+                print(err)
         if process.returncode != 0:
             if not quiet:
                 print("########### Error on call: {}".format(cmd_list))
@@ -505,20 +780,29 @@ class GitLog(object):
     
     def get_current_project_name(self):
         """
-        Extracts project name from window, uglyy right?
+        Extracts project name from window, uglyy right? The result is cached
+        for PROJECT_NAME_TTL seconds so repeated reloads don't fork xdotool.
         """
+        now = time.time()
+        if self._project_name_cache and now - self._project_name_cache[0] < self.PROJECT_NAME_TTL:
+            return self._project_name_cache[1]
+
+        # xdotool matches the window name itself, so only the first match 
+        # needs its name fetched
         w = None
-        wids = self._run_subprocess_command(['xdotool', 'search', 'Burp'], quiet=True).decode()
-        for wid in wids.split('\n'):
-            try:
-                wname = self._run_subprocess_command(['xdotool', 'getwindowname', wid], quiet=True).decode()
-                if wname.startswith("Burp Suite Professional v"):
-                    w = wname
-            except:
-                pass
+        try:
+            wids = self._run_subprocess_command(['xdotool', 'search', '--name', 
+                '^Burp Suite Professional v'], quiet=True).decode().split()
+            if wids:
+                w = self._run_subprocess_command(['xdotool', 'getwindowname', wids[0]], quiet=True).decode()
+        except:
+            pass
         print(w)
+        name = None
         if w:
-            return w.split(' - ')[1].strip()
+            name = w.split(' - ')[1].strip()
+        self._project_name_cache = (now, name)
+        return name
 
     def _generate_path_repo_name(self, repo_name):
         return os.path.join(self.base_path, repo_name)
@@ -531,122 +815,207 @@ class GitLog(object):
         Adds a LogEntry containing Burp Repeater data to the git repo
         '''
 
-        # Make directory for this entry
-
-        entry_dir = os.path.join(self.repo_path, entry.md5)
-        if not os.path.exists(entry_dir):
-            os.mkdir(entry_dir)
-        
-        # Add and commit repeater data to git repo
+        with self._git_lock:
+            # Add and commit repeater data to git repo; write_entry makes
+            # the directory for this entry
 
-        self.write_entry(entry, entry_dir)
-        self._run_subprocess_command(["git", "commit", "-m", "Added Repeater entry"], 
-                cwd=self.repo_path)
+            entry_dir = os.path.join(self.repo_path, entry.md5)
+            paths = self.write_entry(entry, entry_dir)
+            self._run_subprocess_command(["git", "add", "--"] + paths, 
+                    cwd=self.repo_path)
+            self._run_subprocess_command(["git", "commit", "-m", "Added Repeater entry"], 
+                    cwd=self.repo_path)
 
     def add_scanner_entry(self, entry):
         '''
         Adds a LogEntry containing Burp Scanner data to the git repo
         '''
 
-        # Create dir hierarchy for this issue
+        with self._git_lock:
+            # Create dir hierarchy for this issue
+
+            entry_dir = os.path.join(self.repo_path, entry.md5)
 
-        entry_dir = os.path.join(self.repo_path, entry.md5)
 
+            # Log this entry; log 'messages' to its own subdir 
 
-        # Log this entry; log 'messages' to its own subdir 
+            messages = entry.messages
+            paths = self.write_entry(entry, entry_dir)
+            messages_dir = os.path.join(entry_dir, "messages")
+            if self._mkdir(messages_dir):
+                lpath = os.path.join(messages_dir, ".burp-list")
+                open(lpath, "wt").close()
+                paths.append(lpath)
+            i = 0
+            for message in messages:
+                message_dir = os.path.join(messages_dir, str(i))
+                paths.extend(self.write_entry(message, message_dir))
+                i += 1
 
-        messages = entry.messages
-        del entry.__dict__["messages"]
-        self.write_entry(entry, entry_dir)
-        messages_dir = os.path.join(entry_dir, "messages")
-        if not os.path.exists(messages_dir):
-            os.mkdir(messages_dir)
-            lpath = os.path.join(messages_dir, ".burp-list")
-            open(lpath, "wt")
-            self._run_subprocess_command(["git", "add", lpath], cwd=self.repo_path)
-        i = 0
-        for message in messages:
-            message_dir = os.path.join(messages_dir, str(i))
-            if not os.path.exists(message_dir):
-                os.mkdir(message_dir)
-            self.write_entry(message, message_dir)
-            i += 1
+            # Stage everything with a single git call, then commit
 
-        self._run_subprocess_command(["git", "commit", "-m", "Added scanner entry"], 
-                cwd=self.repo_path)
+            self._run_subprocess_command(["git", "add", "--"] + paths, 
+                    cwd=self.repo_path)
+            self._run_subprocess_command(["git", "commit", "-m", "Added scanner entry"], 
+                    cwd=self.repo_path)
+
+
+    def _mkdir(self, path):
+        '''
+        Creates directory path with a single mkdir call instead of an exists 
+        check first. Returns False if it already existed.
+        '''
 
+        try:
+            os.mkdir(path)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+            return False
+        return True
 
     def write_entry(self, entry, entry_dir):
         '''
-        Stores a LogEntry to entry_dir and adds it to git repo.
+        Stores a LogEntry to entry_dir. Returns the list of written paths so 
+        the caller can stage them with a single "git add". Lists such as 
+        "messages" are not written here.
         '''
 
-        if not os.path.exists(entry_dir):
-            os.mkdir(entry_dir)
-        for filename, data in entry.__dict__.iteritems():
-            if not data:
-                data = ""
-            if not getattr(data, "__getitem__", False):
-                data = str(data)
+        self._mkdir(entry_dir)
+        paths = []
+        for filename, data in entry._serialize_fields().iteritems():
             path = os.path.join(entry_dir, filename)
             with open(path, "wb") as fp:
                 fp.write(data)
-                fp.flush()
-            self._run_subprocess_command(["git", "add", path], 
-                    cwd=self.repo_path)
+            paths.append(path)
+        return paths
 
 
     def entries(self):
         '''
-        Generator; yields a LogEntry for each entry in the on-disk git repo
+        Generator; yields a LogEntry for each entry committed to the git repo.
+        Paths are listed by a single "git ls-tree" and file contents are 
+        streamed through a single "git cat-file --batch", instead of walking
+        and opening every file of the working tree.
         '''
 
-        def load_entry(entry_path):
+        def load_entry(node):
             '''
-            Loads a single entry from the path. Could be a "list" entry (see
-            below)
+            Loads a single entry from a tree node ({name: data or subtree}).
+            Could be a "list" entry (see below)
             '''
 
+            if ".burp-list" in node:
+                return load_list(node)
             entry = LogEntry()
-            for filename in os.listdir(entry_path):
-                file_path = os.path.join(entry_path, filename)
-                if os.path.isdir(file_path):
-                    if ".burp-list" in os.listdir(file_path):
-                        list_entry = load_list(file_path)
-                        entry.__dict__[filename] = list_entry
-                    else:
-                        sub_entry = load_entry(file_path)
-                        entry.__dict__[filename] = sub_entry
-                else:
-                    entry.__dict__[filename] = open(file_path, "rb").read()
+            for filename, data in node.items():
+                if isinstance(data, dict):
+                    data = load_entry(data)
+                entry.__dict__[filename] = data
+            entry._intern_fields()
+            entry._set_payload_flags()
             return entry
 
-        def load_list(entry_path):
+        def load_list(node):
             '''
             Loads a "list" entry (corresponds to a python list, or a Java 
             ArrayList, such as the "messages" member of a Burp Scanner Issue).
             '''
 
-            entries = []
-            for filename in os.listdir(entry_path):
-                file_path = os.path.join(entry_path, filename)
-                if filename == ".burp-list":
-                    continue
-                entries.append(load_entry(file_path))
-            return entries
+            names = [n for n in node if n != ".burp-list"]
+            names.sort(key=lambda n: int(n) if n.isdigit() else n)
+            return [load_entry(node[n]) for n in names]
+
+
+        if not self.repo_path or not os.path.exists(self.repo_path):
+            return
+        try:
+            listing = self._run_subprocess_command(["git", "ls-tree", "-r", "-z", "HEAD"], 
+                    cwd=self.repo_path, quiet=True)
+        except Exception:
+            # Nothing committed yet
+            return
+
+        # Only files inside a directory belong to an entry. ls-tree walks 
+        # the tree recursively, so the files of each top-level directory 
+        # are contiguous and can be grouped by it.
+
+        blobs = []
+        for line in listing.split("\0"):
+            if not line:
+                continue
+            meta, path = line.split("\t", 1)
+            if "/" not in path or meta.split()[1] != "blob":
+                continue
+            blobs.append((path, meta.split()[2]))
+
+        # Read, rebuild and yield one entry at a time, so the caller can 
+        # show entries while the rest of the repo is still being read
+
+        for entry_dir, group in itertools.groupby(blobs, lambda b: b[0].split("/", 1)[0]):
+            group = list(group)
+            tree = {}
+            for (path, sha), data in zip(group, self._cat_file([sha for _, sha in group])):
+                node = tree
+                parts = path.split("/")[1:]
+                for part in parts[:-1]:
+                    node = node.setdefault(part, {})
+                node[parts[-1]] = data
+            yield load_entry(tree)
+
+    def _cat_file(self, shas):
+        '''
+        Returns the contents of the given blobs, in order. Blobs are read 
+        through a long-lived "git cat-file --batch" process that is started 
+        on first use and reused by later reloads (see close).
+        '''
+
+        with self._cat_file_lock:
+            process = self._cat_file_process
+            if process is None or process.poll() is not None or \
+                    self._cat_file_repo != self.repo_path:
+                self._close_cat_file()
+                process = subprocess.Popen(["git", "cat-file", "--batch"], 
+                        cwd=self.repo_path, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+                self._cat_file_process = process
+                self._cat_file_repo = self.repo_path
 
+            # Each request is answered by a "<sha> blob <size>\n<contents>\n" 
+            # frame, flushed as soon as it is written
 
-        # Process each of the directories in the underlying git repo 
+            contents = []
+            for sha in shas:
+                process.stdin.write(sha + "\n")
+                process.stdin.flush()
+                header = process.stdout.readline().split()
+                if len(header) != 3:
+                    self._close_cat_file()
+                    raise Exception("Error on call: git cat-file --batch {}".format(sha))
+                contents.append(process.stdout.read(int(header[2])))
+                process.stdout.read(1)
+            return contents
 
-        if self.repo_path:
-            for entry_dir in os.listdir(self.repo_path):
-                if entry_dir == ".git":
-                    continue
-                entry_path = os.path.join(self.repo_path, entry_dir)
-                if not os.path.isdir(entry_path):
-                    continue
-                entry = load_entry(entry_path)
-                yield entry
+    def _close_cat_file(self):
+        '''
+        Stops the "git cat-file --batch" process, if any
+        '''
+
+        process = self._cat_file_process
+        self._cat_file_process = None
+        self._cat_file_repo = None
+        if process is not None and process.poll() is None:
+            process.stdin.close()
+            process.wait()
+
+    def close(self):
+        '''
+        Releases the git processes kept open by this object and stops the 
+        push worker. Called when the extension is unloaded.
+        '''
+
+        with self._cat_file_lock:
+            self._close_cat_file()
+        self._push_q.put(None)
 
 
     def _whoami(self):
@@ -655,59 +1024,142 @@ class GitLog(object):
         created or modified an entry.
         '''
 
+        cwd = self.repo_path
+        if not cwd or not os.path.exists(cwd):
+            cwd = self.base_path
         self.user = self._run_subprocess_command(["git", "config", "user.name"], 
-                cwd=self.repo_path)
+                cwd=cwd).strip()
         return self.user
 
 
     def whoami(self):
         '''
-        wrapper of _whoami
+        Cached wrapper of _whoami: git is only asked once per session, or 
+        again after set_config changes user.name
         '''
 
+        if self.user is None:
+            try:
+                self._whoami()
+            except Exception:
+                pass
         return self.user
 
-    def remove(self, entry):
-        '''
-        Removes the given LogEntry from the underlying git repo.
-        '''
-        self.pull()
-        entry_path = os.path.join(self.repo_path, entry.md5)
-        self._run_subprocess_command(["git", "rm", "-rf", entry_path], 
-           cwd=self.repo_path)
-        self._run_subprocess_command(["git", "commit", "-m", "Removed entry at %s" % 
-            entry_path], cwd=self.repo_path)
+    def remove_entries(self, entries):
+        '''
+        Removes the given LogEntries from the underlying git repo with a 
+        single pull and commit.
+        '''
+        if not entries:
+            return
+        self._fetch()
+        with self._git_lock:
+            self._merge()
+            # Entries removed by someone else arrive with the merge; leaving
+            # them in would make the pathspec commit fail
+            entry_paths = [os.path.join(self.repo_path, entry.md5) for entry in entries]
+            entry_paths = [path for path in entry_paths if os.path.isdir(path)]
+            if not entry_paths:
+                return
+
+            # Delete from the working tree and let "git commit -- paths" stage
+            # the deletions, instead of a separate "git rm" call
+
+            for entry_path in entry_paths:
+                shutil.rmtree(entry_path, ignore_errors=True)
+            if len(entry_paths) == 1:
+                message = "Removed entry at %s" % entry_paths[0]
+            else:
+                message = "Removed %d entries" % len(entry_paths)
+            self._run_subprocess_command(["git", "commit", "-m", message, "--"] + entry_paths, 
+                    cwd=self.repo_path)
 
     def pull(self):
         '''
         pulles the actual state from the underlying git repo.
         '''
+        self._fetch()
+        self._merge()
+
+    def _fetch(self):
+        '''
+        Fetches from the remote. Only remote-tracking refs change, so this
+        runs under _fetch_lock rather than _git_lock and never blocks local
+        commits on the network.
+        '''
         self.add_key_to_know_hosts(self.repo_uri)
-        self._run_subprocess_command(["git", "pull"], cwd=self.repo_path)
+        with self._fetch_lock:
+            self._run_subprocess_command(["git", "fetch", "--quiet"], cwd=self.repo_path)
+
+    def _merge(self):
+        '''
+        Merges the fetched upstream branch into the working tree
+        '''
+        with self._git_lock:
+            self._run_subprocess_command(["git", "merge", "--no-edit", "@{u}"], 
+                    cwd=self.repo_path)
 
     def push(self):
         '''
-        Pushes the actual state from the underlying git repo.
+        Pushes the actual state from the underlying git repo. The push is 
+        queued and done in the background by _push_worker.
+        '''
+        self._push_q.put(True)
+
+    def _push_worker(self):
+        '''
+        Performs queued pushes. Requests that pile up while a push is running
+        are coalesced into a single pull and push. Exits when close() queues
+        None, after any push requested before it.
         '''
-        self.pull()
-        print(self._run_subprocess_command(["git", "push"], cwd=self.repo_path))
+        stop = False
+        while not stop:
+            if self._push_q.get() is None:
+                return
+            try:
+                while True:
+                    if self._push_q.get_nowait() is None:
+                        stop = True
+            except Empty:
+                pass
+            try:
+                # Only the merge in pull holds _git_lock; the network work 
+                # must not block commits made from the Swing thread
+                self.pull()
+                print(self._run_subprocess_command(["git", "push"], cwd=self.repo_path))
+            except Exception as e:
+                print("Push failed: {}".format(e))
 
     def add_key_to_know_hosts(self, repo_uri):
-        server = repo_uri.split('@')[1].split(':')[0]
-        keys = self._run_subprocess_command(["ssh-keyscan", server]).decode()
-        hosts_file = os.path.join(self.home, ".ssh", "known_hosts")
-
-        lines = []
-        if os.path.exists(hosts_file):
-            with open(hosts_file, "r") as f:
-                lines = f.read().split('\n')
+        self._update_known_hosts(self._extract_server(repo_uri))
+
+    def _extract_server(self, repo_uri):
+        return repo_uri.split('@')[1].split(':')[0]
+
+    def _update_known_hosts(self, server):
+        '''
+        Adds the ssh keys of server to ~/.ssh/known_hosts. Each server is 
+        only scanned once per session; the lock keeps the background fetch 
+        and a pull from scanning and writing the file at the same time.
+        '''
+        with self._known_hosts_lock:
+            if server in self._known_hosts_servers:
+                return
+            keys = self._run_subprocess_command(["ssh-keyscan", server]).decode()
+            hosts_file = os.path.join(self.home, ".ssh", "known_hosts")
+
+            lines = []
+            if os.path.exists(hosts_file):
+                with open(hosts_file, "r") as f:
+                    lines = f.read().split('\n')
         
-        for k in keys.split('\n'):
-            if not k in lines:
-                lines.append(k)
+            for k in keys.split('\n'):
+                if not k in lines:
+                    lines.append(k)
 
-        with open(hosts_file, "w") as f:
-            f.write('\n'.join(lines)+'\n')
+            with open(hosts_file, "w") as f:
+                f.write('\n'.join(lines)+'\n')
+            self._known_hosts_servers.add(server)
 
 
     def set_config(self, user, email, repo_uri):
@@ -720,48 +1172,108 @@ class GitLog(object):
         self.user = user
         self.email = email
 
-        self.add_key_to_know_hosts(repo_uri)
+        # Scan the server's ssh keys while git is being configured
+        keyscan = Thread(target=self._update_known_hosts, 
+                args=(self._extract_server(repo_uri),), name="git-bridge-keyscan")
+        keyscan.start()
 
         self._run_subprocess_command(["git", "config", "--global", "user.name", user], cwd=self.base_path)
         self._run_subprocess_command(["git", "config", "--global", "user.email", email], cwd=self.base_path)
+
+        # The clone goes over ssh, so it needs the host keys in place
+        keyscan.join()
         
         if not os.path.exists(self.repo_path):
             self._run_subprocess_command(["git", "clone", repo_uri, self.repo_name], cwd=self.base_path)
+        self._tune_repo()
         
+        # The caller reloads the project next, which starts the prefetch
         self.save_current_project_repo()
 
+    def _prefetch(self):
+        '''
+        Starts a "git fetch" in the background, so that a later pull only 
+        has to merge objects that are already local. Runs under _fetch_lock
+        rather than _git_lock since fetching only updates remote-tracking refs.
+        '''
+        repo_path = self.repo_path
+        repo_uri = self.repo_uri
+        if not repo_path or not os.path.isdir(repo_path):
+            return
+
+        def fetch():
+            try:
+                # ssh needs the host keys in place first
+                self.add_key_to_know_hosts(repo_uri)
+                with self._fetch_lock:
+                    self._run_subprocess_command(["git", "fetch", "--all", "--quiet"], 
+                            cwd=repo_path, quiet=True)
+            except Exception as e:
+                print("Background fetch failed: {}".format(e))
+
+        fetcher = Thread(target=fetch, name="git-bridge-fetch")
+        fetcher.daemon = True
+        fetcher.start()
+
+    def _tune_repo(self):
+        '''
+        Enables git settings that speed up index-heavy commands (add, commit,
+        ls-tree) on the repo. Done once per clone: a marker file in .git/ 
+        records that it was applied.
+        '''
+        git_dir = os.path.join(self.repo_path, ".git")
+        marker = os.path.join(git_dir, "burp-git-bridge-tuned")
+        if not os.path.isdir(git_dir) or os.path.exists(marker):
+            return
+        for key, value in self.REPO_TUNING:
+            self._run_subprocess_command(["git", "config", key, value], 
+                    cwd=self.repo_path, quiet=True)
+        open(marker, "w").close()
+
     def delete_repo_local(self, repo_uri):
         '''
         Deletes local repo_uri folder.
         '''
         repo_name = self._extract_repo_name(repo_uri)
+        with self._cat_file_lock:
+            self._close_cat_file()
         self._run_subprocess_command(["rm", "-rf", repo_name], cwd=self.base_path)
 
-    def set_description(self, entry_hash, description):
+    def set_descriptions(self, entry_hashes, description):
         '''
-        Set description data in local repo folder, commit and push.
+        Set description data of several entries in local repo folder, with
+        a single pull, commit and push. Only entries created by the current 
+        user are edited; returns the hashes of those.
         '''
-        entry_path = os.path.join(self.repo_path, entry_hash)
-        who_file = os.path.join(entry_path, 'who')
-        description_file = os.path.join(entry_path, 'description')
-        
-        with open(who_file, "r") as f:
-            who = f.read()
-        
-        if who != self.whoami():
-            print("You cannot edit description entry that you not created (check 'who' field)")
-            return False
-        
-        self.pull()
-
-        with open(description_file, 'w') as f:
-            f.write(description)
-                
-        self._run_subprocess_command(["git", "add", description_file], 
-                cwd=self.repo_path)
-        self._run_subprocess_command(["git", "commit", "-m", "Edited description entry"], 
-                        cwd=self.repo_path)
-        self.push()
+        editable = []
+        for entry_hash in entry_hashes:
+            who_file = os.path.join(self.repo_path, entry_hash, 'who')
+            with open(who_file, "r") as f:
+                who = f.read()
+            if who != self.whoami():
+                print("You cannot edit description entry that you not created (check 'who' field)")
+                continue
+            editable.append(entry_hash)
+        if not editable:
+            return editable
+
+        self._fetch()
+        with self._git_lock:
+            self._merge()
+
+            paths = []
+            for entry_hash in editable:
+                description_file = os.path.join(self.repo_path, entry_hash, 'description')
+                with open(description_file, 'w') as f:
+                    f.write(description)
+                paths.append(description_file)
+                    
+            self._run_subprocess_command(["git", "add", "--"] + paths, 
+                    cwd=self.repo_path)
+            self._run_subprocess_command(["git", "commit", "-m", "Edited description entry"], 
+                            cwd=self.repo_path)
+            self.push()
+            return editable
 
     def get_actual_repo_uri(self):
         return self.repo_uri
@@ -780,6 +1292,81 @@ class GitLog(object):
 Implementation of extension's UI.
 '''
 
+# Fields left out of the Scanner issue summary: bookkeeping, and bulky 
+# payloads that already have their own tabs
+_SCAN_SUMMARY_SKIP = frozenset(["messages", "tool", "md5", "request", "response", 
+        "requestResponse"])
+
+def _send_to_repeater(callbacks, entry):
+    '''
+    Sends a Repeater entry back to Burp Repeater
+    '''
+
+    https = (entry.protocol == "https")
+    callbacks.sendToRepeater(entry.host, int(entry.port), https, 
+            entry.request, entry.timestamp)
+
+def _send_to_scanner(callbacks, entry):
+    '''
+    Adds a Scanner entry back to Burp Scanner issues
+    '''
+
+    callbacks.addScanIssue(BurpLogScanIssue(entry))
+
+# StringBuilders reused to assemble Scanner issue summaries
+_SB_POOL = []
+
+def _build_scan_summary(log_entry):
+    '''
+    Returns the "key: value" lines of a Scanner issue summary
+    '''
+
+    sb = _SB_POOL.pop() if _SB_POOL else StringBuilder(4096)
+    sb.setLength(0)
+    try:
+        for key in sorted(log_entry.__dict__):
+            if key in _SCAN_SUMMARY_SKIP or key.startswith("_"):
+                continue
+            value = log_entry.__dict__[key]
+            if not isinstance(value, basestring):
+                value = str(value)
+            if sb.length():
+                sb.append("\n\n")
+            sb.append(key).append(": ").append(value)
+        return sb.toString()
+    finally:
+        _SB_POOL.append(sb)
+
+# "Send to Tools" handler for each entry tool
+_SEND_DISPATCH = {
+    "repeater": _send_to_repeater,
+    "scanner": _send_to_scanner,
+}
+
+class GitWorker(SwingWorker):
+    '''
+    Runs git tasks in the background so they don't freeze the UI. The 
+    button that started them is disabled until they are done.
+    '''
+
+    def __init__(self, button, *tasks):
+        self.button = button
+        self.tasks = tasks
+
+    def start(self):
+        self.button.setEnabled(False)
+        self.execute()
+
+    def doInBackground(self):
+        try:
+            for task in self.tasks:
+                task()
+        except Exception as e:
+            print("Git task failed: %s" % e)
+
+    def done(self):
+        self.button.setEnabled(True)
+
 class BurpUi(ITab):
     '''
     The collection of objects that make up this extension's Burp UI. Created
@@ -908,6 +1495,7 @@ class UiBottomPane1(JTabbedPane, IMessageEditorController):
         self._requestViewer = callbacks.createMessageEditor(self, False)
         self._responseViewer = callbacks.createMessageEditor(self, False)
         self._issueViewer = callbacks.createMessageEditor(self, False)
+        self._currentlyDisplayedItem = None
         callbacks.customizeUiComponent(self)
 
     def setLogTable(self, log_table):
@@ -919,15 +1507,6 @@ class UiBottomPane1(JTabbedPane, IMessageEditorController):
         # self.editPanel.log_table = log_table
         self.configPanel.log_table = log_table
 
-    def show_log_entry(self, log_entry):
-        '''
-        Shows the log entry in the bottom pane of the UI
-        '''
-
-        self.removeAll()
-        self.addTab("Commands & Config", self.configPanel)
-        self._currentlyDisplayedItem = log_entry
-
     def getScanIssueSummary(self, log_entry):
         '''
         A quick hack to generate a plaintext summary of a Scanner issue. 
@@ -935,12 +1514,11 @@ class UiBottomPane1(JTabbedPane, IMessageEditorController):
         item is selected.
         '''
 
-        out = []
-        for key, val in sorted(log_entry.__dict__.items()):
-            if key in ["messages", "tool", "md5"]:
-                continue
-            out.append("%s: %s" % (key, val))
-        return "\n\n".join(out)
+        summary = getattr(log_entry, "_scan_summary", None)
+        if summary is None:
+            summary = _build_scan_summary(log_entry)
+            log_entry._scan_summary = summary
+        return summary
         
     '''
     The three methods below implement IMessageEditorController st. requests 
@@ -965,10 +1543,14 @@ class UiBottomPane2(JTabbedPane, IMessageEditorController):
     def __init__(self, callbacks, log):
         self.commandPanel = CommandPanel(callbacks, log)
         self.editPanel = EntryEditPanel(callbacks, log)
-        self.addTab("Entry edit", self.editPanel)
+        self.addTab("Entry Edit", self.editPanel)
         self._requestViewer = callbacks.createMessageEditor(self, False)
         self._responseViewer = callbacks.createMessageEditor(self, False)
         self._issueViewer = callbacks.createMessageEditor(self, False)
+        self._currentlyDisplayedItem = None
+        self._loaded_messages = {}
+        self._syncing = False
+        self.addChangeListener(UiBottomPane2.TabChangeListener(self))
         callbacks.customizeUiComponent(self)
 
     def setLogTable(self, log_table):
@@ -981,23 +1563,82 @@ class UiBottomPane2(JTabbedPane, IMessageEditorController):
 
     def show_log_entry(self, log_entry):
         '''
-        Shows the log entry in the bottom pane of the UI
+        Shows the log entry in the bottom pane of the UI. The Entry Edit tab
+        is always there; the Request, Response and Issue Summary tabs are 
+        only added or removed when needed. Only the selected tab's viewer is 
+        loaded, the others are loaded when their tab is selected.
         '''
 
-        self.removeAll()
-        if getattr(log_entry, "request", False):
-            self.addTab("Request", self._requestViewer.getComponent())
-            self._requestViewer.setMessage(log_entry.request, True)
-        if getattr(log_entry, "response", False):
-            self.addTab("Response", self._responseViewer.getComponent())
-            self._responseViewer.setMessage(log_entry.response, False)
-        if log_entry.tool == "scanner":
-            self.addTab("Issue Summary", self._issueViewer.getComponent())
-            self._issueViewer.setMessage(self.getScanIssueSummary(log_entry), 
-                    False)
-        self.addTab("Entry Edit", self.editPanel)
+        if log_entry is self._currentlyDisplayedItem:
+            return
         self._currentlyDisplayedItem = log_entry
 
+        # Adding and removing tabs changes the selection; only load the 
+        # viewer once all tabs match the new entry
+        self._syncing = True
+        try:
+            position = self._sync_tab(0, "Request", self._requestViewer, 
+                    log_entry._has_request)
+            position = self._sync_tab(position, "Response", self._responseViewer, 
+                    log_entry._has_response)
+            self._sync_tab(position, "Issue Summary", self._issueViewer, 
+                    log_entry.tool == "scanner")
+        finally:
+            self._syncing = False
+        self.load_selected_tab()
+
+    def _sync_tab(self, position, title, viewer, show):
+        '''
+        Adds the viewer's tab at position if needed, or removes it if it 
+        should not be shown. Returns the position of the next tab.
+        '''
+
+        component = viewer.getComponent()
+        index = self.indexOfComponent(component)
+        if not show:
+            if index >= 0:
+                self.removeTabAt(index)
+            return position
+        if index < 0:
+            self.insertTab(title, None, component, None, position)
+        return position + 1
+
+    def load_selected_tab(self):
+        '''
+        Sets the message of the selected tab's viewer from the displayed 
+        entry, unless the viewer already has it
+        '''
+
+        log_entry = self._currentlyDisplayedItem
+        if log_entry is None or self._syncing:
+            return
+        component = self.getSelectedComponent()
+        if component is None:
+            return
+        if component == self._requestViewer.getComponent():
+            viewer, message, isRequest = self._requestViewer, getattr(log_entry, "request", None), True
+        elif component == self._responseViewer.getComponent():
+            viewer, message, isRequest = self._responseViewer, getattr(log_entry, "response", None), False
+        elif component == self._issueViewer.getComponent():
+            viewer, message, isRequest = self._issueViewer, self.getScanIssueSummary(log_entry), False
+        else:
+            return
+        if self._loaded_messages.get(component) is message:
+            return
+        viewer.setMessage(message, isRequest)
+        self._loaded_messages[component] = message
+
+    class TabChangeListener(ChangeListener):
+        '''
+        Loads the viewer of a tab when it gets selected
+        '''
+
+        def __init__(self, pane):
+            self.pane = pane
+
+        def stateChanged(self, event):
+            self.pane.load_selected_tab()
+
     def getScanIssueSummary(self, log_entry):
         '''
         A quick hack to generate a plaintext summary of a Scanner issue. 
@@ -1005,12 +1646,11 @@ class UiBottomPane2(JTabbedPane, IMessageEditorController):
         item is selected.
         '''
 
-        out = []
-        for key, val in sorted(log_entry.__dict__.items()):
-            if key in ["messages", "tool", "md5"]:
-                continue
-            out.append("%s: %s" % (key, val))
-        return "\n\n".join(out)
+        summary = getattr(log_entry, "_scan_summary", None)
+        if summary is None:
+            summary = _build_scan_summary(log_entry)
+            log_entry._scan_summary = summary
+        return summary
         
     '''
     The three methods below implement IMessageEditorController st. requests 
@@ -1048,24 +1688,48 @@ class UiLogTable(JTable):
     ArrayList. 
     '''
 
+    SELECTION_DELAY = 40 # ms
+
     def __init__(self, callbacks, bottom_pane, gui_log):
         self.setAutoCreateRowSorter(True)
         self.bottom_pane = bottom_pane
         self._callbacks = callbacks
         self.gui_log = gui_log
         self.setModel(gui_log)
+        self._selected_row = -1
+        self._selection_timer = Timer(UiLogTable.SELECTION_DELAY, 
+                UiLogTable.ShowSelectionAction(self))
+        self._selection_timer.setRepeats(False)
         callbacks.customizeUiComponent(self)
 
     def getSelectedEntries(self):
-        return [self.gui_log.get(self.convertRowIndexToModel(i)) for i in self.getSelectedRows()]
+        rows = [self.convertRowIndexToModel(i) for i in self.getSelectedRows()]
+        return self.gui_log.get_entries(rows)
     
     def changeSelection(self, row, col, toggle, extend):
         '''
-        Displays the selected item in the content pane
+        Displays the selected item in the content pane. Rapid changes (e.g. 
+        arrow keys held down) are coalesced by a timer so only the last one
+        updates the content pane.
         '''
         
         JTable.changeSelection(self, row, col, toggle, extend)
-        self.bottom_pane.show_log_entry(self.gui_log.get(self.convertRowIndexToModel(row)))
+        self._selected_row = row
+        self._selection_timer.restart()
+
+    class ShowSelectionAction(ActionListener):
+        '''
+        Fired by the selection timer once the selection settles
+        '''
+
+        def __init__(self, table):
+            self.table = table
+
+        def actionPerformed(self, event):
+            row = self.table._selected_row
+            if 0 <= row < self.table.getRowCount():
+                model_row = self.table.convertRowIndexToModel(row)
+                self.table.bottom_pane.show_log_entry(self.table.gui_log.get(model_row))
 
 class EntryEditPanel(JPanel, ActionListener):
     '''
@@ -1088,7 +1752,6 @@ class EntryEditPanel(JPanel, ActionListener):
         boxHorizontal = Box.createHorizontalBox()
         button = JButton("Set new description")
         self.description_box = JTextField('', 10)
-        self.description_box.setText('')
         button.addActionListener(EntryEditPanel.SetDescriptionAction(self, log, self.description_box))
         boxHorizontal.add(JLabel("  New description: "))
         boxHorizontal.add(self.description_box)
@@ -1112,10 +1775,7 @@ class EntryEditPanel(JPanel, ActionListener):
             removes it from the Log. 
             '''
             entries = self.panel.log_table.getSelectedEntries()
-            for entry in entries:
-                self.log.set_description(entry.md5, self.description_box.getText())
-            
-            self.log.reload()
+            self.log.set_descriptions(entries, self.description_box.getText())
 
 
 
@@ -1174,32 +1834,26 @@ class ConfigPanel(JPanel, ActionListener):
         except:
             self.name = ""
 
-        to_disable = []
-
         boxHorizontal = Box.createHorizontalBox()
-        self.user_box = JTextField('', 10)
-        self.user_box.setText(self.name)
+        self.user_box = JTextField(self.name, 10)
         boxHorizontal.add(JLabel("  user.name: "))
         boxHorizontal.add(self.user_box)
         self.add(boxHorizontal)
 
         boxHorizontal = Box.createHorizontalBox()
-        self.email_box = JTextField('', 10)
-        self.email_box.setText(self.email)
+        self.email_box = JTextField(self.email, 10)
         boxHorizontal.add(JLabel("  user.email: "))
         boxHorizontal.add(self.email_box)
         self.add(boxHorizontal)
 
         boxHorizontal = Box.createHorizontalBox()
-        self.repo_box = JTextField('', 10)
-        self.repo_box.setText(self.repo)
+        self.repo_box = JTextField(self.repo, 10)
         boxHorizontal.add(JLabel("  Git Repo: "))
         boxHorizontal.add(self.repo_box)
         self.add(boxHorizontal)
 
         boxHorizontal = Box.createHorizontalBox()
-        self.key_pub_box = JTextField('', 10)
-        self.key_pub_box.setText(self.key_pub)
+        self.key_pub_box = JTextField(self.key_pub, 10)
         boxHorizontal.add(JLabel("  Copy your ~/.ssh/id_rsa.pub: "))
         boxHorizontal.add(self.key_pub_box)
         self.add(boxHorizontal)
@@ -1210,7 +1864,6 @@ class ConfigPanel(JPanel, ActionListener):
         boxHorizontal.add(JLabel("Set, save and reload values:"))
         boxHorizontal.add(button)
         self.add(boxHorizontal)
-        to_disable.append(button)
 
         boxHorizontal = Box.createHorizontalBox()
         button = JButton("Delete")
@@ -1218,7 +1871,6 @@ class ConfigPanel(JPanel, ActionListener):
         boxHorizontal.add(JLabel("Delete repo locally to clone again later (will lose all changes):"))
         boxHorizontal.add(button)
         self.add(boxHorizontal)
-        to_disable.append(button)
 
     class ReloadAction(ActionListener):
         '''
@@ -1229,7 +1881,7 @@ class ConfigPanel(JPanel, ActionListener):
             self.log = log
     
         def actionPerformed(self, event):
-            self.log.reload()
+            self.log.request_reload()
 
     class SendAction(ActionListener):
         '''
@@ -1245,15 +1897,11 @@ class ConfigPanel(JPanel, ActionListener):
             calls the proper Burp "send to" callback with the entry data.
             '''
 
+            callbacks = self.panel.callbacks
             for entry in self.panel.log_table.getSelectedEntries():
-                if entry.tool == "repeater":
-                    https = (entry.protocol == "https")
-                    self.panel.callbacks.sendToRepeater(entry.host, 
-                            int(entry.port), https, entry.request, 
-                            entry.timestamp)
-                elif entry.tool == "scanner":
-                    issue = BurpLogScanIssue(entry)
-                    self.panel.callbacks.addScanIssue(issue)
+                handler = _SEND_DISPATCH.get(entry.tool)
+                if handler:
+                    handler(callbacks, entry)
 
     class RemoveAction(ActionListener):
         '''
@@ -1270,8 +1918,7 @@ class ConfigPanel(JPanel, ActionListener):
             removes it from the Log. 
             '''
             entries = self.panel.log_table.getSelectedEntries()
-            for entry in entries:
-                self.log.remove(entry)
+            self.log.remove_entries(entries)
 
     class RemoveSafeAction(ActionListener):
         '''
@@ -1287,12 +1934,13 @@ class ConfigPanel(JPanel, ActionListener):
             Iterates over each entry that is selected in the UI table and 
             removes it from the Log. 
             '''
-            entries = self.panel.log_table.getSelectedEntries()
-            for entry in entries:
+            entries = []
+            for entry in self.panel.log_table.getSelectedEntries():
                 if self.log.git_log.whoami()  == entry.who:
-                    self.log.remove(entry)
+                    entries.append(entry)
                 else:
                     print("cannot safe remove other people entries.")
+            self.log.remove_entries(entries)
 
     class PullAction(ActionListener):
         '''
@@ -1304,8 +1952,7 @@ class ConfigPanel(JPanel, ActionListener):
             self._callbacks = callbacks
     
         def actionPerformed(self, event):
-            self.log.pull()
-            self.log.reload()
+            GitWorker(event.getSource(), self.log.pull, self.log.request_reload).start()
             
     class PushAction(ActionListener):
         '''
@@ -1336,9 +1983,9 @@ class ConfigPanel(JPanel, ActionListener):
             self.repo = self.callbacks.saveExtensionSetting("git_repo", self.repo_box.getText())
             self.email = self.callbacks.saveExtensionSetting("git_email", self.email_box.getText())
             self.name = self.callbacks.saveExtensionSetting("git_name", self.user_box.getText())
-            self.log.set_config(self.user_box.getText(), self.email_box.getText(), self.repo_box.getText())
-            self.log.reload_project()
-            self.log.reload()
+            user, email, repo = self.user_box.getText(), self.email_box.getText(), self.repo_box.getText()
+            GitWorker(event.getSource(), lambda: self.log.set_config(user, email, repo),
+                    self.log.reload_project, self.log.request_reload).start()
 
     class DeleteAction(ActionListener):
         '''
@@ -1353,26 +2000,6 @@ class ConfigPanel(JPanel, ActionListener):
             self.log.delete_repo_local(self.repo_box.getText())
 
 
-    class ReloadActualProjectAction(ActionListener):
-        '''
-        Handles when the "ReloadActualProject" button is clicked.
-        '''
-
-        def __init__(self, log, repo_box, to_disable, panel):
-            self.log = log
-            self.repo_box = repo_box
-            self.to_disable = to_disable
-            self.panel = panel
-    
-        def actionPerformed(self, event):
-            self.log.reload_project()
-            self.repo_box.setText(self.log.get_actual_repo_uri())
-            for item in self.to_disable:
-                item.setVisible(True)
-            self.panel.revalidate()
-            self.panel.repaint()
-
-
 class CommandPanel(JPanel, ActionListener):
     '''
     This is the "Git Bridge Commands" Panel shown in the bottom of the Git
@@ -1445,7 +2072,7 @@ class CommandPanel(JPanel, ActionListener):
             self.log = log
     
         def actionPerformed(self, event):
-            self.log.reload()
+            self.log.request_reload()
 
     class SendAction(ActionListener):
         '''
@@ -1461,15 +2088,11 @@ class CommandPanel(JPanel, ActionListener):
             calls the proper Burp "send to" callback with the entry data.
             '''
 
+            callbacks = self.panel.callbacks
             for entry in self.panel.log_table.getSelectedEntries():
-                if entry.tool == "repeater":
-                    https = (entry.protocol == "https")
-                    self.panel.callbacks.sendToRepeater(entry.host, 
-                            int(entry.port), https, entry.request, 
-                            entry.timestamp)
-                elif entry.tool == "scanner":
-                    issue = BurpLogScanIssue(entry)
-                    self.panel.callbacks.addScanIssue(issue)
+                handler = _SEND_DISPATCH.get(entry.tool)
+                if handler:
+                    handler(callbacks, entry)
 
     class RemoveAction(ActionListener):
         '''
@@ -1486,8 +2109,7 @@ class CommandPanel(JPanel, ActionListener):
             removes it from the Log. 
             '''
             entries = self.panel.log_table.getSelectedEntries()
-            for entry in entries:
-                self.log.remove(entry)
+            self.log.remove_entries(entries)
 
     class RemoveSafeAction(ActionListener):
         '''
@@ -1503,12 +2125,13 @@ class CommandPanel(JPanel, ActionListener):
             Iterates over each entry that is selected in the UI table and 
             removes it from the Log. 
             '''
-            entries = self.panel.log_table.getSelectedEntries()
-            for entry in entries:
+            entries = []
+            for entry in self.panel.log_table.getSelectedEntries():
                 if self.log.git_log.whoami()  == entry.who:
-                    self.log.remove(entry)
+                    entries.append(entry)
                 else:
                     print("cannot safe remove other people entries.")
+            self.log.remove_entries(entries)
 
     class PullAction(ActionListener):
         '''
@@ -1520,8 +2143,7 @@ class CommandPanel(JPanel, ActionListener):
             self._callbacks = callbacks
     
         def actionPerformed(self, event):
-            self.log.pull()
-            self.log.reload()
+            GitWorker(event.getSource(), self.log.pull, self.log.request_reload).start()
             
     class PushAction(ActionListener):
         '''
@@ -1560,6 +2182,20 @@ class BurpLogHttpService(IHttpService):
     def getProtocol(self):
         return self._protocol
 
+# One BurpLogHttpService per (host, port, protocol), shared by every entry
+_SERVICE_CACHE = {}
+
+def _get_service(host, port, protocol):
+    '''
+    Returns the shared BurpLogHttpService for host, port and protocol
+    '''
+
+    key = (host, int(port), protocol)
+    service = _SERVICE_CACHE.get(key)
+    if service is None:
+        service = _SERVICE_CACHE[key] = BurpLogHttpService(host, port, protocol)
+    return service
+
 class BurpLogHttpRequestResponse(IHttpRequestResponse):
     '''
     Burp expects the object passed to "addScanIssue" to include a member 
@@ -1574,7 +2210,7 @@ class BurpLogHttpRequestResponse(IHttpRequestResponse):
     def getResponse(self):
         return self.entry.response
     def getHttpService(self):
-        return BurpLogHttpService(self.entry.host,
+        return _get_service(self.entry.host,
                 self.entry.port, self.entry.protocol)
 
 
@@ -1590,8 +2226,17 @@ class BurpLogScanIssue(IScanIssue):
 
     def __init__(self, entry):
         self.entry = entry
-        self.messages = [BurpLogHttpRequestResponse(m) for m in self.entry.messages]
-        self.service = BurpLogHttpService(self.entry.host, self.entry.port, self.entry.protocol)
+
+        # The wrappers only depend on the entry, so they are built once and 
+        # kept on it for later "Send to Tool" clicks
+
+        cached = getattr(entry, "_cached_issue", None)
+        if cached is None:
+            cached = ([BurpLogHttpRequestResponse(m) for m in self.entry.messages],
+                    _get_service(self.entry.host, self.entry.port, self.entry.protocol),
+                    URL(self.entry.url))
+            entry._cached_issue = cached
+        self.messages, self.service, self._url = cached
 
     def getHttpMessages(self):
         return self.messages
@@ -1613,4 +2258,4 @@ class BurpLogScanIssue(IScanIssue):
     def getSeverity(self):
         return self.entry.severity
     def getUrl(self):
-        return URL(self.entry.url)
+        return self._url